@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
+
 
 class User(AbstractUser):
     class Role(models.TextChoices):
@@ -13,5 +15,13 @@ class User(AbstractUser):
     avatar = models.ImageField(upload_to="avatars/", blank=True, null=True)
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.EMPLOYEE)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # password reset looks users up with email__iexact / username__iexact
+            models.Index(Upper("email"), name="user_email_ci_idx"),
+            models.Index(Upper("username"), name="user_uname_ci_idx"),
+            models.Index(fields=["role"], name="user_role_idx"),
+        ]
+
     def is_admin(self) -> bool:
         return self.role == self.Role.ADMIN
@@ -1,7 +1,6 @@
 from django.conf import settings
+from django.db import models
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import serializers
@@ -9,51 +8,113 @@ import logging
 from .models import User
 logger = logging.getLogger(__name__)
 
+def _avatar_url(obj, request):
+    if obj.avatar and hasattr(obj.avatar, "url"):
+        url = obj.avatar.url
+        if request and url.startswith("/"):
+            # resolve scheme/host once per request instead of once per row
+            base = getattr(request, "_abs_base", None)
+            if base is None:
+                base = request.build_absolute_uri("/")[:-1]
+                request._abs_base = base
+            return f"{base}{url}"
+        return url
+    return None
+
+
+class UserPublicListSerializer(serializers.ListSerializer):
+    """
+    Renders a list of users in one pass instead of running
+    UserPublicSerializer.to_representation (and every bound field) per row.
+    """
+
+    def to_representation(self, data):
+        request = self.context.get("request")
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return [
+            {
+                "id": u.id,
+                "username": u.username,
+                "email": u.email,
+                "first_name": u.first_name,
+                "last_name": u.last_name,
+                "role": u.role,
+                "avatar_url": _avatar_url(u, request),
+            }
+            for u in iterable
+        ]
+
+
 class UserPublicSerializer(serializers.ModelSerializer):
     avatar_url = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = ["id", "username", "email", "first_name", "last_name", "role", "avatar_url"]
+        list_serializer_class = UserPublicListSerializer
 
     def get_avatar_url(self, obj):
-        request = self.context.get("request")
-        if obj.avatar and hasattr(obj.avatar, "url"):
-            if request:
-                return request.build_absolute_uri(obj.avatar.url)
-            return obj.avatar.url
-        return None
+        return _avatar_url(obj, self.context.get("request"))
 
 
-class MeSerializer(UserPublicSerializer):
-    pass
+class UserMiniSerializer(serializers.ModelSerializer):
+    """Compact user shape for embedding in other resources (*_detail fields)."""
 
+    avatar_url = serializers.SerializerMethodField()
 
-class MeUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ["first_name", "last_name", "email"]
+        fields = ["id", "username", "first_name", "last_name", "avatar_url"]
+
+    def get_avatar_url(self, obj):
+        return _avatar_url(obj, self.context.get("request"))
+
+
+class MeSerializer(UserPublicSerializer):
+    pass
+
+
+class MeUpdateSerializer(UserPublicSerializer):
+    """Validates the editable profile fields and renders the same shape as MeSerializer."""
+
+    class Meta(UserPublicSerializer.Meta):
+        read_only_fields = ["id", "username", "role"]
+
+    def update(self, instance, validated_data):
+        # only write the columns the PATCH actually sent
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data.keys()))
+        return instance
 
 
 
 # accounts/serializers.py
 
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import serializers
 
+from .tasks import send_password_reset_email_async
+
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
 
+@lru_cache(maxsize=1024)
+def _uid_for(pk: int) -> str:
+    return urlsafe_base64_encode(force_bytes(pk))
+
+
 class PasswordResetRequestSerializer(serializers.Serializer):
     email_or_username = serializers.CharField()
 
@@ -61,11 +122,14 @@ class PasswordResetRequestSerializer(serializers.Serializer):
         value = self.validated_data["email_or_username"].strip()
         request = self.context.get("request")
 
+        # only the columns PasswordResetTokenGenerator hashes
+        users = User.objects.only("id", "password", "last_login", "email")
+
         user = None
         if "@" in value:
-            user = User.objects.filter(email__iexact=value).first()
+            user = users.filter(email__iexact=value).first()
         else:
-            user = User.objects.filter(username__iexact=value).first()
+            user = users.filter(username__iexact=value).first()
 
         # Always act success (security best practice)
         if not user:
@@ -75,7 +139,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
         if not user.email:
             return
 
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
+        uid = _uid_for(user.pk)
         token = default_token_generator.make_token(user)
 
         frontend_url = getattr(settings, "FRONTEND_URL", "").rstrip("/")
@@ -88,41 +152,8 @@ class PasswordResetRequestSerializer(serializers.Serializer):
 
         reset_link = f"{frontend_url}/reset-password/{uid}/{token}"
 
-        subject = "Reset your password"
-        ctx = {
-            "user": user,
-            "reset_link": reset_link,
-            "app_name": getattr(settings, "APP_NAME", "Smart Asset System"),
-        }
-
-        # You can use templates (recommended). If missing, fallback to a simple text.
-        try:
-            text_body = render_to_string("accounts/password_reset_email.txt", ctx)
-        except Exception:
-            text_body = f"Use this link to reset your password: {reset_link}"
-
-        try:
-            html_body = render_to_string("accounts/password_reset_email.html", ctx)
-        except Exception:
-            html_body = (
-                f"<p>Use this link to reset your password:</p>"
-                f"<p><a href='{reset_link}'>{reset_link}</a></p>"
-            )
-
-        msg = EmailMultiAlternatives(
-            subject=subject,
-            body=text_body,
-            from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-            to=[user.email],
-        )
-        msg.attach_alternative(html_body, "text/html")
-
-        try:
-            msg.send(fail_silently=False)
-            logger.info("Password reset email sent to %s", user.email)
-        except Exception:
-            logger.exception("Password reset email FAILED for %s", user.email)
-            # keep API response generic for security, so don't raise
+        # build + send happens off the request thread
+        send_password_reset_email_async(user.pk, reset_link)
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -132,6 +163,12 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     def validate(self, attrs):
         if attrs["new_password1"] != attrs["new_password2"]:
             raise serializers.ValidationError({"new_password2": "Passwords do not match."})
+
+        # reject weak passwords here, before save() pays for the lookup + hashing
+        try:
+            validate_password(attrs["new_password1"])
+        except DjangoValidationError as e:
+            raise serializers.ValidationError({"new_password1": list(e.messages)})
         return attrs
 
     def save(self):
@@ -140,7 +177,7 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
 
         try:
             uid = force_str(urlsafe_base64_decode(uidb64))
-            user = User.objects.get(pk=uid)
+            user = User.objects.only("id", "password", "last_login", "email").get(pk=uid)
         except Exception:
             raise serializers.ValidationError({"detail": "Invalid reset link."})
 
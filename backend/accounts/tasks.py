@@ -0,0 +1,113 @@
+# accounts/tasks.py
+
+import logging
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from core.background import submit
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# Each worker thread keeps one open mail connection and reuses it across sends.
+_local = threading.local()
+
+
+def _get_mail_connection():
+    conn = getattr(_local, "mail_connection", None)
+    if conn is None:
+        conn = get_connection()
+        conn.open()
+        _local.mail_connection = conn
+    return conn
+
+
+def _reset_mail_connection():
+    conn = getattr(_local, "mail_connection", None)
+    _local.mail_connection = None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_TXT_FALLBACK = "Use this link to reset your password: {reset_link}"
+_HTML_FALLBACK = (
+    "<p>Use this link to reset your password:</p>"
+    "<p><a href='{reset_link}'>{reset_link}</a></p>"
+)
+
+
+@lru_cache(maxsize=None)
+def _load_template(name):
+    # look up + compile once per process, None if the template isn't shipped
+    try:
+        return get_template(name)
+    except TemplateDoesNotExist:
+        return None
+
+
+def _render(name, ctx, fallback):
+    tmpl = _load_template(name)
+    if tmpl is not None:
+        try:
+            return tmpl.render(ctx)
+        except Exception:
+            logger.exception("Failed to render %s", name)
+    return fallback.format(**ctx)
+
+
+def send_password_reset_email(user_id, reset_link):
+    """Build and send the password reset email (runs on the background pool)."""
+    user = (
+        User.objects.only("id", "email", "username", "first_name", "last_name")
+        .filter(pk=user_id)
+        .first()
+    )
+    if not user or not user.email:
+        return
+
+    subject = "Reset your password"
+    ctx = {
+        "user": user,
+        "reset_link": reset_link,
+        "app_name": getattr(settings, "APP_NAME", "Smart Asset System"),
+    }
+
+    # You can use templates (recommended). If missing, fallback to a simple text.
+    text_body = _render("accounts/password_reset_email.txt", ctx, _TXT_FALLBACK)
+    html_body = _render("accounts/password_reset_email.html", ctx, _HTML_FALLBACK)
+
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_body,
+        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        to=[user.email],
+    )
+    msg.attach_alternative(html_body, "text/html")
+
+    for attempt in range(2):
+        try:
+            msg.connection = _get_mail_connection()
+            msg.send(fail_silently=False)
+            logger.info("Password reset email sent to %s", user.email)
+            break
+        except Exception:
+            # the server may have dropped the idle reused connection,
+            # so retry once on a fresh one before giving up
+            _reset_mail_connection()
+            if attempt:
+                logger.exception("Password reset email FAILED for %s", user.email)
+                # keep API response generic for security, so don't raise
+
+
+def send_password_reset_email_async(user_id, reset_link):
+    return submit(send_password_reset_email, user_id, reset_link)
@@ -1,3 +1,150 @@
-from django.test import TestCase
+import hashlib
+import tempfile
+from io import BytesIO
+from smtplib import SMTPServerDisconnected
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from . import tasks
+
+User = get_user_model()
+
+
+class FakeConnection:
+    def __init__(self, sent, fail=False):
+        self.sent = sent
+        self.fail = fail
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send_messages(self, messages):
+        if self.fail:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.extend(messages)
+        return len(messages)
+
+
+class PasswordResetEmailTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="emp", email="emp@example.com", password="pw"
+        )
+        tasks._reset_mail_connection()
+        self.addCleanup(tasks._reset_mail_connection)
+
+    def test_dropped_connection_is_retried_on_a_fresh_one(self):
+        sent = []
+        # first connection was dropped by the server while idle
+        tasks._local.mail_connection = FakeConnection(sent, fail=True)
+
+        with mock.patch.object(tasks, "get_connection", return_value=FakeConnection(sent)):
+            tasks.send_password_reset_email(self.user.pk, "http://example.com/reset")
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0].to, ["emp@example.com"])
+
+
+@override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+class PasswordResetConfirmThrottleTests(TestCase):
+    url = "/api/auth/password-reset/bad-uid/bad-token/"
+    proxy = {"REMOTE_ADDR": "10.1.0.1"}
+
+    def setUp(self):
+        caches["shared"].clear()
+        self.addCleanup(caches["shared"].clear)
+        self.client = APIClient()
+
+    def _post(self, **extra):
+        return self.client.post(
+            self.url,
+            {"new_password1": "x", "new_password2": "x"},
+            format="json",
+            **extra,
+        )
+
+    def test_sixth_attempt_in_a_minute_is_throttled(self):
+        for _ in range(5):
+            self.assertEqual(self._post().status_code, 400)
+        self.assertEqual(self._post().status_code, 429)
+
+    def test_different_remote_addrs_get_separate_budgets(self):
+        for _ in range(5):
+            self.assertEqual(self._post(REMOTE_ADDR="198.51.100.1").status_code, 400)
+        self.assertEqual(self._post(REMOTE_ADDR="198.51.100.1").status_code, 429)
+        self.assertEqual(self._post(REMOTE_ADDR="198.51.100.2").status_code, 400)
+
+    def test_clients_behind_the_proxy_get_separate_budgets(self):
+        for _ in range(5):
+            self._post(HTTP_X_FORWARDED_FOR="198.51.100.1", **self.proxy)
+        self.assertEqual(
+            self._post(HTTP_X_FORWARDED_FOR="198.51.100.1", **self.proxy).status_code, 429
+        )
+        self.assertEqual(
+            self._post(HTTP_X_FORWARDED_FOR="198.51.100.2", **self.proxy).status_code, 400
+        )
+
+    def test_spoofed_forwarded_for_does_not_reset_the_budget(self):
+        # the proxy appends the address it saw, only that last hop is trusted
+        statuses = [
+            self._post(HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 198.51.100.1", **self.proxy).status_code
+            for i in range(7)
+        ]
+        self.assertEqual(statuses[:5], [400] * 5)
+        self.assertEqual(statuses[5:], [429, 429])
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class AvatarUploadTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="emp", email="emp@example.com", password="pw"
+        )
+
+    def _png(self):
+        buf = BytesIO()
+        Image.new("RGB", (300, 200), "red").save(buf, format="PNG")
+        buf.seek(0)
+        buf.name = "My Pic.png"
+        return buf
+
+    def test_upload_is_named_after_stored_content(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post("/api/me/avatar/", {"avatar": self._png()}, format="multipart")
+        self.assertEqual(response.status_code, 200)
+
+        self.user.refresh_from_db()
+        with self.user.avatar.open("rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.assertEqual(self.user.avatar.name, f"avatars/{digest}.jpg")
+
+    def test_field_file_save_works_without_prior_avatar(self):
+        self.user.avatar.save("plain.png", ContentFile(b"data"))
+        self.assertEqual(self.user.avatar.name, "avatars/plain.png")
+
+    def test_user_list_avatar_url_is_escaped_like_me(self):
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pw", role="ADMIN"
+        )
+        # name stored by an upload from before avatars were content-addressed
+        User.objects.filter(pk=self.user.pk).update(avatar="avatars/My Pic.png")
+        client = APIClient()
+        client.force_authenticate(admin)
+        listed = client.get("/api/users/").data["results"]
+        url = next(u["avatar_url"] for u in listed if u["id"] == self.user.id)
+        self.assertEqual(url, "http://testserver/media/avatars/My%20Pic.png")
+
+        self.user.refresh_from_db()
+        client.force_authenticate(self.user)
+        self.assertEqual(client.get("/api/me/").data["avatar_url"], url)
@@ -1,8 +1,17 @@
+import hashlib
+from io import BytesIO
+
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from PIL import Image, ImageOps
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework import status, viewsets
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.throttling import ScopedRateThrottle
 
 from .models import User
 from .serializers import (
@@ -14,18 +23,57 @@ from .serializers import (
 )
 from core.permissions import IsAdminRole
 
+AVATAR_SIZE = (128, 128)
+
+
+def _avatar_thumbnail(upload):
+    """
+    Resize an uploaded avatar once at upload time so every later GET serves a small JPEG.
+    Raises OSError / Image.DecompressionBombError if the file isn't a readable image.
+    """
+    im = Image.open(upload)
+    im = ImageOps.exif_transpose(im).convert("RGB")
+    im.thumbnail(AVATAR_SIZE, Image.Resampling.LANCZOS)
+
+    buf = BytesIO()
+    im.save(buf, format="JPEG", quality=85)
+    data = buf.getvalue()
+    # content-addressed name, so a changed avatar always gets a new URL
+    name = hashlib.sha1(data).hexdigest() + ".jpg"
+    return ContentFile(data, name=name)
+
+
+def _me_etag(request, *args, **kwargs):
+    # covers every field MeSerializer renders, so any profile/avatar change busts it
+    user = request.user
+    raw = "|".join(
+        str(v)
+        for v in (
+            user.pk,
+            user.username,
+            user.email,
+            user.first_name,
+            user.last_name,
+            user.role,
+            user.avatar.name if user.avatar else "",
+            request.get_host(),
+        )
+    )
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
 
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(condition(etag_func=_me_etag))
     def get(self, request):
         return Response(MeSerializer(request.user, context={"request": request}).data)
 
     def patch(self, request):
-        ser = MeUpdateSerializer(request.user, data=request.data, partial=True)
+        ser = MeUpdateSerializer(request.user, data=request.data, partial=True, context={"request": request})
         ser.is_valid(raise_exception=True)
         ser.save()
-        return Response(MeSerializer(request.user, context={"request": request}).data)
+        return Response(ser.data)
 
 
 class MeAvatarUploadView(APIView):
@@ -37,7 +85,12 @@ class MeAvatarUploadView(APIView):
         if not avatar:
             return Response({"detail": "avatar file is required"}, status=status.HTTP_400_BAD_REQUEST)
 
-        request.user.avatar = avatar
+        try:
+            thumb = _avatar_thumbnail(avatar)
+        except (OSError, Image.DecompressionBombError):
+            return Response({"detail": "avatar must be a valid image"}, status=status.HTTP_400_BAD_REQUEST)
+
+        request.user.avatar = thumb
         request.user.save(update_fields=["avatar"])
         return Response(MeSerializer(request.user, context={"request": request}).data)
 
@@ -47,6 +100,11 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = UserPublicSerializer
     permission_classes = [IsAuthenticated, IsAdminRole]
 
+    def get_queryset(self):
+        # only load the columns UserPublicSerializer renders (avatar_url is built from avatar)
+        fields = [f for f in UserPublicSerializer.Meta.fields if f != "avatar_url"]
+        return super().get_queryset().only(*fields, "avatar")
+
 
 class PasswordResetRequestView(APIView):
     permission_classes = []
@@ -66,8 +124,16 @@ class PasswordResetRequestView(APIView):
         )
 
 
+class SharedScopedRateThrottle(ScopedRateThrottle):
+    # the default cache is per process, so the budget would be multiplied by the worker count
+    cache = caches["shared"]
+
+
 class PasswordResetConfirmView(APIView):
     permission_classes = []
+    # checked before any user lookup / token hashing
+    throttle_classes = [SharedScopedRateThrottle]
+    throttle_scope = "password_reset_confirm"
 
     def post(self, request, uidb64, token):
         serializer = PasswordResetConfirmSerializer(
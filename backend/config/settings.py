@@ -102,6 +102,23 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    "DEFAULT_THROTTLE_RATES": {
+        "password_reset_confirm": "5/min",
+    },
+    # only the last N X-Forwarded-For hops (added by our own proxies) are trusted,
+    # 0 = use REMOTE_ADDR and ignore the header. Deployed builds sit behind the
+    # platform's proxy, so REMOTE_ADDR is the proxy and one hop is trusted by default
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0" if DEBUG else "1")),
+}
+
+CACHES = {
+    # per-process, for data that can be a little stale (dashboard, admin ids)
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    # shared by every worker, for counters that must be global (throttling)
+    "shared": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    },
 }
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -117,6 +134,9 @@ USE_I18N = True
 USE_TZ = True
 
 STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage"
+    },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"
     }
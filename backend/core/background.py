@@ -0,0 +1,29 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# One small in-process pool for work that shouldn't hold up the response
+# (reset emails, notification fan-out). Pass plain values, not request-bound objects.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+
+def _run(fn, args, kwargs):
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s FAILED", fn.__qualname__)
+    finally:
+        # worker threads keep their own DB connection, drop it if it went stale
+        close_old_connections()
+
+
+def submit(fn, *args, **kwargs):
+    return _executor.submit(_run, fn, args, kwargs)
+
+
+def submit_on_commit(fn, *args, **kwargs):
+    # the worker never sees (or acts on) rows that end up rolled back
+    transaction.on_commit(lambda: submit(fn, *args, **kwargs))
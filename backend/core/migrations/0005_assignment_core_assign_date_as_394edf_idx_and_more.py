@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_assignment_return_note_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['-date_assigned'], name='core_assign_date_as_394edf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repairticket',
+            index=models.Index(fields=['-created_at'], name='core_repair_created_9f6168_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_assignment_core_assign_date_as_394edf_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['status'], name='core_asset_status_166994_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['employee', 'asset'], name='core_assign_employe_948d82_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='repairticket',
+            index=models.Index(fields=['status'], name='core_repair_status_eb2dd4_idx'),
+        ),
+    ]
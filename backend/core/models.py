@@ -15,6 +15,11 @@ class Asset(models.Model):
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.AVAILABLE)
     purchase_date = models.DateField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status"]),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.serial_number})"
 
@@ -59,6 +64,10 @@ class Assignment(models.Model):
 
     class Meta:
         ordering = ["-date_assigned"]
+        indexes = [
+            models.Index(fields=["-date_assigned"]),
+            models.Index(fields=["employee", "asset"]),
+        ]
 
 class RepairTicket(models.Model):
     class Status(models.TextChoices):
@@ -98,4 +107,8 @@ class RepairTicket(models.Model):
     )
 
     class Meta:
-        ordering = ["-created_at"]
\ No newline at end of file
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["status"]),
+        ]
@@ -0,0 +1,42 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that reads the planner's row estimate instead of running
+    COUNT(*) for unfiltered lists of large Postgres tables.
+    """
+
+    # below this the estimate isn't worth the inaccuracy, count exactly
+    estimate_threshold = 1000
+
+    def _estimated_rows(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @cached_property
+    def count(self):
+        # any WHERE (role scoping, ?q=, ?status=, ...) needs an exact count
+        if isinstance(self.object_list, QuerySet) and not self.object_list.query.where:
+            estimate = self._estimated_rows()
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return super().count
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
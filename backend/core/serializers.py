@@ -1,35 +1,60 @@
 # backend/core/serializers.py
 
+from django.db import models
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 from .models import Asset, InventoryItem, Assignment, RepairTicket
-from accounts.serializers import UserPublicSerializer
+from accounts.serializers import UserMiniSerializer
 
 
 class AssetSerializer(serializers.ModelSerializer):
     class Meta:
         model = Asset
-        fields = "__all__"
+        fields = ["id", "name", "type", "serial_number", "status", "purchase_date"]
+
+
+class AssetMiniSerializer(serializers.ModelSerializer):
+    """Compact asset shape for embedding in assignments/tickets."""
+
+    class Meta:
+        model = Asset
+        fields = ["id", "name", "serial_number", "status"]
 
 
 class InventoryItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = InventoryItem
-        fields = "__all__"
+        fields = ["id", "item_type", "quantity", "threshold"]
 
 
 class AssignmentSerializer(serializers.ModelSerializer):
-    asset_detail = AssetSerializer(source="asset", read_only=True)
+    asset_detail = AssetMiniSerializer(source="asset", read_only=True)
 
     # convenience fields
     employee_username = serializers.ReadOnlyField(source="employee.username")
 
     # new detail fields (safe even if null)
-    employee_detail = UserPublicSerializer(source="employee", read_only=True)
-    returned_by_detail = UserPublicSerializer(source="returned_by", read_only=True)
+    employee_detail = UserMiniSerializer(source="employee", read_only=True)
+    returned_by_detail = UserMiniSerializer(source="returned_by", read_only=True)
 
     class Meta:
         model = Assignment
-        fields = "__all__"
+        fields = [
+            "id",
+            "asset",
+            "asset_detail",
+            "employee",
+            "employee_username",
+            "employee_detail",
+            "date_assigned",
+            "date_returned",
+            "status",
+            "return_requested_at",
+            "return_note",
+            "returned_at",
+            "returned_by",
+            "returned_by_detail",
+        ]
         # These should be server-controlled
         read_only_fields = (
             "return_requested_at",
@@ -53,14 +78,29 @@ class RepairTicketSerializer(serializers.ModelSerializer):
     resolved_by = serializers.ReadOnlyField(source="resolved_by_id")
 
     # detail objects
-    asset_detail = AssetSerializer(source="asset", read_only=True)
-    created_by_detail = UserPublicSerializer(source="created_by", read_only=True)
-    assigned_technician_detail = UserPublicSerializer(source="assigned_technician", read_only=True)
-    resolved_by_detail = UserPublicSerializer(source="resolved_by", read_only=True)
+    asset_detail = AssetMiniSerializer(source="asset", read_only=True)
+    created_by_detail = UserMiniSerializer(source="created_by", read_only=True)
+    assigned_technician_detail = UserMiniSerializer(source="assigned_technician", read_only=True)
+    resolved_by_detail = UserMiniSerializer(source="resolved_by", read_only=True)
 
     class Meta:
         model = RepairTicket
-        fields = "__all__"
+        fields = [
+            "id",
+            "asset",
+            "asset_detail",
+            "issue",
+            "status",
+            "assigned_technician",
+            "assigned_technician_detail",
+            "created_by",
+            "created_by_detail",
+            "created_at",
+            "resolution_note",
+            "resolved_at",
+            "resolved_by",
+            "resolved_by_detail",
+        ]
 
         # Server controlled fields
         read_only_fields = (
@@ -82,15 +122,38 @@ class RepairTicketSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class PrefetchingListSerializer(serializers.ListSerializer):
+    """
+    Loads the child's related objects for the whole list before rendering,
+    so callers that forget select_related don't fall into N+1.
+    Relations already cached on the instances are skipped (no extra query).
+    """
+
+    related = ()
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        prefetch_related_objects(items, *self.related)
+        return super().to_representation(items)
+
+
+class RecentTicketListSerializer(PrefetchingListSerializer):
+    related = ("asset", "assigned_technician", "created_by", "resolved_by")
+
+
+class RecentAssignmentListSerializer(PrefetchingListSerializer):
+    related = ("asset", "employee", "returned_by")
+
+
 class RecentTicketSerializer(serializers.ModelSerializer):
-    asset_detail = AssetSerializer(source="asset", read_only=True)
+    asset_detail = AssetMiniSerializer(source="asset", read_only=True)
     created_by = serializers.ReadOnlyField(source="created_by_id")
 
-    created_by_detail = UserPublicSerializer(source="created_by", read_only=True)
-    assigned_technician_detail = UserPublicSerializer(source="assigned_technician", read_only=True)
+    created_by_detail = UserMiniSerializer(source="created_by", read_only=True)
+    assigned_technician_detail = UserMiniSerializer(source="assigned_technician", read_only=True)
 
     resolved_by = serializers.ReadOnlyField(source="resolved_by_id")
-    resolved_by_detail = UserPublicSerializer(source="resolved_by", read_only=True)
+    resolved_by_detail = UserMiniSerializer(source="resolved_by", read_only=True)
 
     class Meta:
         model = RepairTicket
@@ -110,12 +173,13 @@ class RecentTicketSerializer(serializers.ModelSerializer):
             "resolved_by",
             "resolved_by_detail",
         ]
+        list_serializer_class = RecentTicketListSerializer
 
 
 class RecentAssignmentSerializer(serializers.ModelSerializer):
-    asset_detail = AssetSerializer(source="asset", read_only=True)
-    employee_detail = UserPublicSerializer(source="employee", read_only=True)
-    returned_by_detail = UserPublicSerializer(source="returned_by", read_only=True)
+    asset_detail = AssetMiniSerializer(source="asset", read_only=True)
+    employee_detail = UserMiniSerializer(source="employee", read_only=True)
+    returned_by_detail = UserMiniSerializer(source="returned_by", read_only=True)
 
     class Meta:
         model = Assignment
@@ -133,4 +197,5 @@ class RecentAssignmentSerializer(serializers.ModelSerializer):
             "returned_at",
             "returned_by",
             "returned_by_detail",
-        ]
\ No newline at end of file
+        ]
+        list_serializer_class = RecentAssignmentListSerializer
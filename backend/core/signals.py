@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Asset, InventoryItem, RepairTicket
+from .utils import ADMIN_IDS_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_saved_invalidate_admin_ids(sender, instance, created, update_fields=None, **kwargs):
+    # saves that can't touch role (e.g. last_login on login) keep the cache
+    if update_fields is not None and "role" not in update_fields:
+        return
+    cache.delete(ADMIN_IDS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_deleted_invalidate_admin_ids(sender, instance, **kwargs):
+    cache.delete(ADMIN_IDS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=RepairTicket)
+def status_saved_invalidate_dashboard(sender, instance, created, update_fields=None, **kwargs):
+    if not created and update_fields is not None and "status" not in update_fields:
+        return
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+@receiver(post_save, sender=InventoryItem)
+def inventory_saved_invalidate_dashboard(sender, instance, created, **kwargs):
+    # only the item count is on the dashboard
+    if created:
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=Asset)
+@receiver(post_delete, sender=InventoryItem)
+@receiver(post_delete, sender=RepairTicket)
+def row_deleted_invalidate_dashboard(sender, instance, **kwargs):
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
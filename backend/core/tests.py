@@ -1,3 +1,97 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Asset, Assignment, RepairTicket
+from .pagination import EstimatedCountPaginator
+from .utils import ADMIN_IDS_CACHE_KEY, get_admin_ids
+
+User = get_user_model()
+
+
+class EstimatedCountPaginationTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pw", role="ADMIN"
+        )
+        for i in range(3):
+            Asset.objects.create(name=f"Laptop {i}", type="Laptop", serial_number=f"SN-{i}")
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _get(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        count_queries = [q["sql"] for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()]
+        return response.data, count_queries
+
+    def test_unfiltered_list_uses_estimate_above_threshold(self):
+        with mock.patch.object(EstimatedCountPaginator, "_estimated_rows", return_value=5000):
+            data, count_queries = self._get("/api/assets/")
+        self.assertEqual(data["count"], 5000)
+        self.assertEqual(count_queries, [])
+
+    def test_unfiltered_list_counts_exactly_below_threshold(self):
+        with mock.patch.object(EstimatedCountPaginator, "_estimated_rows", return_value=10):
+            data, count_queries = self._get("/api/assets/")
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(len(count_queries), 1)
+
+    def test_filtered_list_counts_exactly(self):
+        with mock.patch.object(
+            EstimatedCountPaginator, "_estimated_rows", return_value=5000
+        ) as estimated:
+            data, count_queries = self._get("/api/assets/?q=Laptop 1")
+        estimated.assert_not_called()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(len(count_queries), 1)
+
+
+class RecentActivityTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pw", role="ADMIN"
+        )
+        self.emp = User.objects.create_user(
+            username="emp", email="emp@example.com", password="pw"
+        )
+        mine = Asset.objects.create(name="Laptop", type="Laptop", serial_number="SN-1")
+        other = Asset.objects.create(name="Phone", type="Phone", serial_number="SN-2")
+        Assignment.objects.create(asset=mine, employee=self.emp, date_assigned="2026-01-01")
+        self.my_ticket = RepairTicket.objects.create(asset=mine, issue="broken", created_by=self.admin)
+        RepairTicket.objects.create(asset=other, issue="cracked", created_by=self.admin)
+        self.client = APIClient()
+
+    def test_employee_sees_tickets_on_assigned_assets(self):
+        self.client.force_authenticate(self.emp)
+        response = self.client.get("/api/recent-activity/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([t["id"] for t in response.data["tickets"]], [self.my_ticket.id])
+        self.assertEqual(len(response.data["assignments"]), 1)
+
+    def test_admin_sees_everything(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get("/api/recent-activity/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["tickets"]), 2)
+
+
+class AdminIdsCacheTests(TestCase):
+    def setUp(self):
+        cache.delete(ADMIN_IDS_CACHE_KEY)
+        self.addCleanup(cache.delete, ADMIN_IDS_CACHE_KEY)
+
+    def test_empty_roster_is_not_cached(self):
+        self.assertEqual(get_admin_ids(), [])
+        self.assertIsNone(cache.get(ADMIN_IDS_CACHE_KEY))
 
-# Create your tests here.
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pw", role="ADMIN"
+        )
+        self.assertEqual(get_admin_ids(), [admin.id])
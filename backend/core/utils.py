@@ -0,0 +1,23 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+ADMIN_IDS_CACHE_KEY = "admin_user_ids_v1"
+DASHBOARD_STATS_CACHE_KEY = "core:dashboard_stats:v1"
+
+# The default cache is per process: core.signals only clears the copy in the
+# worker that saved the user, so other workers can lag by up to this long.
+ADMIN_IDS_TTL = 30
+
+
+def get_admin_ids():
+    """
+    IDs of ADMIN users, cached briefly since the roster rarely changes.
+    An empty roster is never cached, so a newly created admin is seen right away.
+    """
+    ids = cache.get(ADMIN_IDS_CACHE_KEY)
+    if ids is None:
+        User = get_user_model()
+        ids = list(User.objects.filter(role="ADMIN").values_list("id", flat=True))
+        if ids:
+            cache.set(ADMIN_IDS_CACHE_KEY, ids, ADMIN_IDS_TTL)
+    return ids
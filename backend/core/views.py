@@ -1,7 +1,8 @@
 # backend/core/views.py
 
-from django.db.models import Count, Q
-from django.contrib.auth import get_user_model
+from django.db.models import Count, Exists, OuterRef, Q
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
 from rest_framework import status, viewsets
@@ -19,15 +20,75 @@ from .serializers import (
     RecentTicketSerializer,
     RecentAssignmentSerializer,
 )
+from .pagination import EstimatedCountPagination
 from .permissions import AdminWriteElseReadOnly, TicketPermission, is_admin
+from .utils import DASHBOARD_STATS_CACHE_KEY, get_admin_ids
 from notifications.models import Notification
+from notifications.tasks import fanout_notifications, queue_notifications
+
+
+def _asset_label(asset):
+    return f"{asset.name} ({asset.serial_number})"
+
+
+def _ticket_to_dict(ticket):
+    """
+    Scalar fields of RepairTicketSerializer (no *_detail objects), built straight
+    from the in-memory ticket for the mark-done / approve-close JSON responses.
+    """
+    return {
+        "id": ticket.id,
+        "asset": ticket.asset_id,
+        "issue": ticket.issue,
+        "status": ticket.status,
+        "assigned_technician": ticket.assigned_technician_id,
+        "created_by": ticket.created_by_id,
+        "created_at": ticket.created_at,
+        "resolution_note": ticket.resolution_note,
+        "resolved_at": ticket.resolved_at,
+        "resolved_by": ticket.resolved_by_id,
+    }
+
+
+def _ticket_response(view, request, ticket):
+    # browsable API keeps the full serializer form
+    if request.accepted_renderer.format == "json":
+        return Response(_ticket_to_dict(ticket), status=status.HTTP_200_OK)
+    return Response(view.get_serializer(ticket).data, status=status.HTTP_200_OK)
+
+
+# columns read by the embedded AssetMiniSerializer / UserMiniSerializer (*_detail fields)
+ASSET_DETAIL_COLUMNS = ("id", "name", "serial_number", "status")
+USER_DETAIL_COLUMNS = ("id", "username", "first_name", "last_name", "avatar")
+
+
+def _with_details(qs, assets=(), users=()):
+    """
+    select_related the given FKs but only load the columns their *_detail
+    serializers render, instead of whole asset/user rows (password, last_login, ...).
+    """
+    own = [f.name for f in qs.model._meta.concrete_fields]
+    related = [f"{rel}__{col}" for rel in assets for col in ASSET_DETAIL_COLUMNS]
+    related += [f"{rel}__{col}" for rel in users for col in USER_DETAIL_COLUMNS]
+    return qs.select_related(*assets, *users).only(*own, *related)
+
+
+def _tickets_with_details():
+    return _with_details(
+        RepairTicket.objects.all(),
+        assets=["asset"],
+        users=["assigned_technician", "created_by", "resolved_by"],
+    )
+
 
-User = get_user_model()
+def _assignments_with_details():
+    return _with_details(Assignment.objects.all(), assets=["asset"], users=["employee", "returned_by"])
 
 
 class AssetViewSet(viewsets.ModelViewSet):
     queryset = Asset.objects.all().order_by("-id")
     serializer_class = AssetSerializer
+    pagination_class = EstimatedCountPagination
     permission_classes = [AdminWriteElseReadOnly]
 
     def get_queryset(self):
@@ -36,16 +97,15 @@ class AssetViewSet(viewsets.ModelViewSet):
 
         employee = self.request.query_params.get("employee")
 
-        if is_admin(user) and employee:
-            assigned_asset_ids = Assignment.objects.filter(employee_id=employee).values_list(
-                "asset_id", flat=True
+        user_is_admin = is_admin(user)
+        if user_is_admin and employee:
+            qs = qs.filter(
+                Exists(Assignment.objects.filter(asset_id=OuterRef("pk"), employee_id=employee))
             )
-            qs = qs.filter(id__in=assigned_asset_ids).distinct()
-        elif not is_admin(user):
-            assigned_asset_ids = Assignment.objects.filter(employee=user).values_list(
-                "asset_id", flat=True
+        elif not user_is_admin:
+            qs = qs.filter(
+                Exists(Assignment.objects.filter(asset_id=OuterRef("pk"), employee=user))
             )
-            qs = qs.filter(id__in=assigned_asset_ids).distinct()
 
         q = self.request.query_params.get("q")
         status_ = self.request.query_params.get("status")
@@ -61,12 +121,13 @@ class AssetViewSet(viewsets.ModelViewSet):
 class InventoryViewSet(viewsets.ModelViewSet):
     queryset = InventoryItem.objects.all().order_by("item_type")
     serializer_class = InventoryItemSerializer
+    pagination_class = EstimatedCountPagination
     permission_classes = [AdminWriteElseReadOnly]
 
 
 
 class AssignmentViewSet(viewsets.ModelViewSet):
-    queryset = Assignment.objects.select_related("asset", "employee").all()
+    queryset = _assignments_with_details()
     serializer_class = AssignmentSerializer
 
     def get_queryset(self):
@@ -94,24 +155,27 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         # only admin can create/update/delete
         return [AdminWriteElseReadOnly()]
 
+    @transaction.atomic
     def perform_create(self, serializer):
         assignment = serializer.save()
 
-        # keep asset status in sync
+        # keep asset status in sync (asset is already loaded by the serializer)
         if assignment.asset_id:
-            Asset.objects.filter(id=assignment.asset_id).update(status=Asset.Status.ASSIGNED)
+            assignment.asset.status = Asset.Status.ASSIGNED
+            assignment.asset.save(update_fields=["status"])
 
-        # notify employee
+        # notify employee (after commit, off the request thread)
         if assignment.employee_id and assignment.asset_id:
-            Notification.objects.create(
-                user=assignment.employee,
+            fanout_notifications(
+                [assignment.employee_id],
                 notif_type=Notification.Type.ASSET_ASSIGNED,
                 title="Asset assigned",
-                message=f"{assignment.asset.name} ({assignment.asset.serial_number}) was assigned to you.",
+                message=f"{_asset_label(assignment.asset)} was assigned to you.",
                 entity_type="assignment",
                 entity_id=assignment.id,
             )
 
+    @transaction.atomic
     def perform_update(self, serializer):
         """
         Admin updates assignment.
@@ -121,42 +185,54 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         old = self.get_object()
         assignment = serializer.save()
 
-        old_emp_id = getattr(old, "employee_id", None)
-        new_emp_id = getattr(assignment, "employee_id", None)
+        old_emp_id = old.employee_id
+        new_emp_id = assignment.employee_id
 
-        old_return = getattr(old, "date_returned", None)
-        new_return = getattr(assignment, "date_returned", None)
+        old_return = old.date_returned
+        new_return = assignment.date_returned
 
         asset = assignment.asset
+        asset_label = _asset_label(asset)
+
+        notifications = []
 
         # employee changed, notify new employee
         if new_emp_id and new_emp_id != old_emp_id:
-            Notification.objects.create(
-                user=assignment.employee,
-                notif_type=Notification.Type.ASSET_ASSIGNED,
-                title="Asset assigned",
-                message=f"{asset.name} ({asset.serial_number}) was assigned to you.",
-                entity_type="assignment",
-                entity_id=assignment.id,
+            notifications.append(
+                Notification(
+                    user_id=new_emp_id,
+                    notif_type=Notification.Type.ASSET_ASSIGNED,
+                    title="Asset assigned",
+                    message=f"{asset_label} was assigned to you.",
+                    entity_type="assignment",
+                    entity_id=assignment.id,
+                )
             )
 
         # returned just now (date_returned changed from null to a date)
         if old_return is None and new_return is not None and assignment.employee_id:
             # mark asset as available again
             if assignment.asset_id:
-                Asset.objects.filter(id=assignment.asset_id).update(status=Asset.Status.AVAILABLE)
+                asset.status = Asset.Status.AVAILABLE
+                asset.save(update_fields=["status"])
 
             # notify employee
-            Notification.objects.create(
-                user=assignment.employee,
-                notif_type=Notification.Type.ASSIGNMENT_RETURNED,
-                title="Asset returned",
-                message=f"{asset.name} ({asset.serial_number}) was marked as returned.",
-                entity_type="assignment",
-                entity_id=assignment.id,
+            notifications.append(
+                Notification(
+                    user_id=assignment.employee_id,
+                    notif_type=Notification.Type.ASSIGNMENT_RETURNED,
+                    title="Asset returned",
+                    message=f"{asset_label} was marked as returned.",
+                    entity_type="assignment",
+                    entity_id=assignment.id,
+                )
             )
 
+        # both notifications go out in one INSERT after commit
+        queue_notifications(notifications)
+
     @action(detail=True, methods=["post"], url_path="request-return")
+    @transaction.atomic
     def request_return(self, request, pk=None):
         """
         Employee requests admin to mark an assignment as returned.
@@ -177,33 +253,28 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         note = (request.data.get("note") or "").strip()
 
         asset = assignment.asset
-        asset_label = f"{asset.name} ({asset.serial_number})"
+        asset_label = _asset_label(asset)
         msg = f"{user.username} requested return for {asset_label}."
         if note:
             msg += f" Note: {note}"
 
-        admins = User.objects.filter(role="ADMIN")
-        if not admins.exists():
+        admin_ids = get_admin_ids()
+        if not admin_ids:
             return Response({"detail": "No admin users found"}, status=status.HTTP_400_BAD_REQUEST)
 
-        Notification.objects.bulk_create(
-            [
-                Notification(
-                    user=admin,
-                    notif_type=Notification.Type.ASSIGNMENT_RETURNED,
-                    title="Return requested",
-                    message=msg,
-                    entity_type="assignment",
-                    entity_id=assignment.id,
-                )
-                for admin in admins
-            ]
+        fanout_notifications(
+            admin_ids,
+            notif_type=Notification.Type.ASSIGNMENT_RETURNED,
+            title="Return requested",
+            message=msg,
+            entity_type="assignment",
+            entity_id=assignment.id,
         )
 
-        assignment.refresh_from_db()
         return Response(self.get_serializer(assignment).data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["post"], url_path="confirm-return")
+    @transaction.atomic
     def confirm_return(self, request, pk=None):
         """
         Admin confirms return and sets date_returned.
@@ -221,25 +292,24 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         assignment.save(update_fields=["date_returned"])
 
         if assignment.asset_id:
-            Asset.objects.filter(id=assignment.asset_id).update(status=Asset.Status.AVAILABLE)
+            assignment.asset.status = Asset.Status.AVAILABLE
+            assignment.asset.save(update_fields=["status"])
 
-        asset = assignment.asset
-        Notification.objects.create(
-            user=assignment.employee,
+        asset_label = _asset_label(assignment.asset)
+        fanout_notifications(
+            [assignment.employee_id],
             notif_type=Notification.Type.ASSIGNMENT_RETURNED,
             title="Return confirmed",
-            message=f"Admin confirmed return for {asset.name} ({asset.serial_number}).",
+            message=f"Admin confirmed return for {asset_label}.",
             entity_type="assignment",
             entity_id=assignment.id,
         )
 
-        assignment.refresh_from_db()
         return Response(self.get_serializer(assignment).data, status=status.HTTP_200_OK)
 class TicketViewSet(viewsets.ModelViewSet):
-    queryset = RepairTicket.objects.select_related(
-        "asset", "assigned_technician", "created_by", "resolved_by"
-    ).all()
+    queryset = _tickets_with_details()
     serializer_class = RepairTicketSerializer
+    pagination_class = EstimatedCountPagination
     permission_classes = [TicketPermission]
 
     def get_queryset(self):
@@ -249,19 +319,20 @@ class TicketViewSet(viewsets.ModelViewSet):
 
         if is_admin(user):
             if employee:
-                emp_asset_ids = Assignment.objects.filter(employee_id=employee).values_list("asset_id", flat=True)
+                emp_assignments = Assignment.objects.filter(asset_id=OuterRef("asset_id"), employee_id=employee)
                 return qs.filter(
                     Q(created_by_id=employee)
                     | Q(assigned_technician_id=employee)
-                    | Q(asset_id__in=emp_asset_ids)
-                ).distinct()
+                    | Exists(emp_assignments)
+                )
             return qs
 
-        my_asset_ids = Assignment.objects.filter(employee=user).values_list("asset_id", flat=True)
+        my_assignments = Assignment.objects.filter(asset_id=OuterRef("asset_id"), employee=user)
         return qs.filter(
-            Q(created_by=user) | Q(assigned_technician=user) | Q(asset_id__in=my_asset_ids)
-        ).distinct()
+            Q(created_by=user) | Q(assigned_technician=user) | Exists(my_assignments)
+        )
 
+    @transaction.atomic
     def perform_create(self, serializer):
         user = self.request.user
 
@@ -269,19 +340,13 @@ class TicketViewSet(viewsets.ModelViewSet):
         if not is_admin(user):
             ticket = serializer.save(created_by=user, assigned_technician=None)
 
-            admins = User.objects.filter(role="ADMIN")
-            Notification.objects.bulk_create(
-                [
-                    Notification(
-                        user=admin,
-                        notif_type=Notification.Type.TICKET_CREATED,
-                        title="New ticket created",
-                        message=f"{user.username} created a ticket for {ticket.asset.name} ({ticket.asset.serial_number}).",
-                        entity_type="ticket",
-                        entity_id=ticket.id,
-                    )
-                    for admin in admins
-                ]
+            fanout_notifications(
+                get_admin_ids(),
+                notif_type=Notification.Type.TICKET_CREATED,
+                title="New ticket created",
+                message=f"{user.username} created a ticket for {_asset_label(ticket.asset)}.",
+                entity_type="ticket",
+                entity_id=ticket.id,
             )
             return
 
@@ -289,15 +354,16 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = serializer.save(created_by=user)
 
         if ticket.assigned_technician_id:
-            Notification.objects.create(
-                user=ticket.assigned_technician,
+            fanout_notifications(
+                [ticket.assigned_technician_id],
                 notif_type=Notification.Type.TICKET_UPDATED,
                 title="Ticket assigned",
-                message=f"You were assigned a ticket for {ticket.asset.name} ({ticket.asset.serial_number}).",
+                message=f"You were assigned a ticket for {_asset_label(ticket.asset)}.",
                 entity_type="ticket",
                 entity_id=ticket.id,
             )
 
+    @transaction.atomic
     def perform_update(self, serializer):
         user = self.request.user
         if not is_admin(user):
@@ -309,33 +375,39 @@ class TicketViewSet(viewsets.ModelViewSet):
 
         ticket = serializer.save()
 
-        asset_label = (
-            f"{ticket.asset.name} ({ticket.asset.serial_number})"
-            if ticket.asset_id and ticket.asset
-            else ""
-        )
+        asset_label = _asset_label(ticket.asset) if ticket.asset_id and ticket.asset else ""
+
+        notifications = []
 
         if ticket.assigned_technician_id and ticket.assigned_technician_id != old_assignee:
-            Notification.objects.create(
-                user=ticket.assigned_technician,
-                notif_type=Notification.Type.TICKET_UPDATED,
-                title="Ticket assigned",
-                message=("You were assigned a ticket" + (f" for {asset_label}." if asset_label else ".")),
-                entity_type="ticket",
-                entity_id=ticket.id,
+            notifications.append(
+                Notification(
+                    user_id=ticket.assigned_technician_id,
+                    notif_type=Notification.Type.TICKET_UPDATED,
+                    title="Ticket assigned",
+                    message=("You were assigned a ticket" + (f" for {asset_label}." if asset_label else ".")),
+                    entity_type="ticket",
+                    entity_id=ticket.id,
+                )
             )
 
         if ticket.status != old_status and ticket.created_by_id:
-            Notification.objects.create(
-                user=ticket.created_by,
-                notif_type=Notification.Type.TICKET_UPDATED,
-                title="Ticket updated",
-                message=f"Ticket status changed: {old_status} -> {ticket.status}",
-                entity_type="ticket",
-                entity_id=ticket.id,
+            notifications.append(
+                Notification(
+                    user_id=ticket.created_by_id,
+                    notif_type=Notification.Type.TICKET_UPDATED,
+                    title="Ticket updated",
+                    message=f"Ticket status changed: {old_status} -> {ticket.status}",
+                    entity_type="ticket",
+                    entity_id=ticket.id,
+                )
             )
 
+        # reassign + status change go out in one INSERT after commit
+        queue_notifications(notifications)
+
     @action(detail=True, methods=["post"], url_path="mark-done")
+    @transaction.atomic
     def mark_done(self, request, pk=None):
         """
         Technician marks ticket as RESOLVED with an optional note.
@@ -359,40 +431,40 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket.resolution_note = note
         ticket.resolved_at = timezone.now()
         ticket.resolved_by = user
-        ticket.save(update_fields=["status", "resolution_note", "resolved_at", "resolved_by"])
+        # single UPDATE, the in-memory ticket already holds the new values for the response
+        RepairTicket.objects.filter(pk=ticket.pk).update(
+            status=ticket.status,
+            resolution_note=note,
+            resolved_at=ticket.resolved_at,
+            resolved_by=user,
+        )
+        # .update() skips post_save, so drop the stale open-ticket count here
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
 
-        recipients = set()
+        # creator + all admins (admin ids come from cache, no per-request query)
+        recipients = set(get_admin_ids())
         if ticket.created_by_id:
             recipients.add(ticket.created_by_id)
-
-        for admin_id in User.objects.filter(role="ADMIN").values_list("id", flat=True):
-            recipients.add(admin_id)
-
         recipients.discard(user.id)
 
-        asset_label = f"{ticket.asset.name} ({ticket.asset.serial_number})"
+        asset_label = _asset_label(ticket.asset)
         msg = f"Work marked done for {asset_label}."
         if note:
             msg = msg + f" Note: {note}"
 
-        Notification.objects.bulk_create(
-            [
-                Notification(
-                    user_id=uid,
-                    notif_type=Notification.Type.TICKET_UPDATED,
-                    title="Ticket resolved",
-                    message=msg,
-                    entity_type="ticket",
-                    entity_id=ticket.id,
-                )
-                for uid in recipients
-            ]
+        fanout_notifications(
+            recipients,
+            notif_type=Notification.Type.TICKET_UPDATED,
+            title="Ticket resolved",
+            message=msg,
+            entity_type="ticket",
+            entity_id=ticket.id,
         )
 
-        ticket.refresh_from_db()
-        return Response(self.get_serializer(ticket).data, status=status.HTTP_200_OK)
+        return _ticket_response(self, request, ticket)
 
     @action(detail=True, methods=["post"], url_path="approve-close")
+    @transaction.atomic
     def approve_close(self, request, pk=None):
         """
         Admin verifies and closes a RESOLVED ticket.
@@ -411,47 +483,44 @@ class TicketViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Ticket must be RESOLVED before closing"}, status=status.HTTP_400_BAD_REQUEST)
 
         ticket.status = RepairTicket.Status.CLOSED
-        ticket.save(update_fields=["status"])
+        RepairTicket.objects.filter(pk=ticket.pk).update(status=ticket.status)
 
-        recipients = set()
-        if ticket.created_by_id:
-            recipients.add(ticket.created_by_id)
-        if ticket.assigned_technician_id:
-            recipients.add(ticket.assigned_technician_id)
+        recipients = {uid for uid in (ticket.created_by_id, ticket.assigned_technician_id) if uid}
 
-        asset_label = f"{ticket.asset.name} ({ticket.asset.serial_number})"
+        asset_label = _asset_label(ticket.asset)
 
-        Notification.objects.bulk_create(
-            [
-                Notification(
-                    user_id=uid,
-                    notif_type=Notification.Type.TICKET_UPDATED,
-                    title="Ticket closed",
-                    message=f"Admin verified and closed the ticket for {asset_label}.",
-                    entity_type="ticket",
-                    entity_id=ticket.id,
-                )
-                for uid in recipients
-            ]
+        fanout_notifications(
+            recipients,
+            notif_type=Notification.Type.TICKET_UPDATED,
+            title="Ticket closed",
+            message=f"Admin verified and closed the ticket for {asset_label}.",
+            entity_type="ticket",
+            entity_id=ticket.id,
         )
 
-        ticket.refresh_from_db()
-        return Response(self.get_serializer(ticket).data, status=status.HTTP_200_OK)
+        return _ticket_response(self, request, ticket)
 
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def dashboard_stats(request):
+def _compute_dashboard_stats():
     asset_by_status = list(
         Asset.objects.values("status").annotate(count=Count("id")).order_by("status")
     )
+    # asset totals come from the grouped rows above, no extra scans of the asset table
+    counts = {row["status"]: row["count"] for row in asset_by_status}
     totals = {
-        "assets_total": Asset.objects.count(),
+        "assets_total": sum(counts.values()),
         "inventory_items_total": InventoryItem.objects.count(),
         "open_tickets": RepairTicket.objects.filter(status="OPEN").count(),
-        "assigned_assets": Asset.objects.filter(status="ASSIGNED").count(),
+        "assigned_assets": counts.get("ASSIGNED", 0),
     }
-    return Response({"totals": totals, "asset_by_status": asset_by_status})
+    return {"totals": totals, "asset_by_status": asset_by_status}
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def dashboard_stats(request):
+    # counts are the same for every user and fine to be a few seconds stale
+    return Response(cache.get_or_set(DASHBOARD_STATS_CACHE_KEY, _compute_dashboard_stats, 30))
 
 
 @api_view(["GET"])
@@ -461,25 +530,16 @@ def recent_activity(request):
     limit = int(request.query_params.get("limit", 5))
 
     if is_admin(user):
-        tickets_qs = RepairTicket.objects.select_related(
-            "asset", "assigned_technician", "created_by", "resolved_by"
-        ).order_by("-created_at")[:limit]
+        tickets_qs = _tickets_with_details().order_by("-created_at")[:limit]
 
-        assignments_qs = Assignment.objects.select_related(
-            "asset", "employee"
-        ).order_by("-date_assigned")[:limit]
+        assignments_qs = _assignments_with_details().order_by("-date_assigned")[:limit]
     else:
-        tickets_qs = RepairTicket.objects.select_related(
-            "asset", "assigned_technician", "created_by", "resolved_by"
-        ).filter(
-            Q(created_by=user)
-            | Q(assigned_technician=user)
-            | Q(asset_id__in=Assignment.objects.filter(employee=user).values_list("asset_id", flat=True))
-        ).distinct().order_by("-created_at")[:limit]
-
-        assignments_qs = Assignment.objects.select_related(
-            "asset", "employee"
-        ).filter(employee=user).order_by("-date_assigned")[:limit]
+        my_assignments = Assignment.objects.filter(asset_id=OuterRef("asset_id"), employee=user)
+        tickets_qs = _tickets_with_details().filter(
+            Q(created_by=user) | Q(assigned_technician=user) | Exists(my_assignments)
+        ).order_by("-created_at")[:limit]
+
+        assignments_qs = _assignments_with_details().filter(employee=user).order_by("-date_assigned")[:limit]
 
     return Response(
         {
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-15 22:20
+
+from django.db import migrations, models
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Cast, Concat
+
+
+LINK_PATHS = {
+    "assignment": "/assignments",
+    "ticket": "/tickets",
+    "asset": "/assets",
+}
+
+
+def backfill_links(apps, schema_editor):
+    Notification = apps.get_model("notifications", "Notification")
+    # one UPDATE ... SET link = CASE entity_type ... for all existing rows
+    Notification.objects.filter(entity_id__isnull=False).exclude(entity_id=0).update(
+        link=Case(
+            *[
+                When(
+                    entity_type=entity_type,
+                    then=Concat(
+                        Value(f"{path}?focus="),
+                        Cast("entity_id", output_field=CharField()),
+                        output_field=CharField(),
+                    ),
+                )
+                for entity_type, path in LINK_PATHS.items()
+            ],
+            default=Value(""),
+            output_field=CharField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_unread_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='link',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.RunPython(backfill_links, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,20 @@
 from django.conf import settings
 from django.db import models
 
+# frontend routes that a notification's entity deep-links to
+ENTITY_LINK_PATHS = {
+    "assignment": "/assignments",
+    "ticket": "/tickets",
+    "asset": "/assets",
+}
+
+
+def build_link(entity_type, entity_id):
+    path = ENTITY_LINK_PATHS.get(entity_type)
+    if path and entity_id:
+        return f"{path}?focus={entity_id}"
+    return ""
+
 
 class Notification(models.Model):
     class Type(models.TextChoices):
@@ -24,6 +38,8 @@ class Notification(models.Model):
     # Deep link helpers for frontend navigation
     entity_type = models.CharField(max_length=40, blank=True)  # "ticket" | "asset" | "assignment"
     entity_id = models.IntegerField(null=True, blank=True)
+    # built from entity_type/entity_id on write so list responses don't recompute it
+    link = models.CharField(max_length=200, blank=True, default="")
 
     read_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -32,9 +48,19 @@ class Notification(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "created_at"]),
-            models.Index(fields=["user", "read_at"]),
+            # unread rows only (mark-all-read), much smaller than a full (user, read_at) index
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=models.Q(read_at__isnull=True),
+                name="notif_user_unread_partial",
+            ),
         ]
 
+    def save(self, *args, **kwargs):
+        if not self.link:
+            self.link = build_link(self.entity_type, self.entity_id)
+        super().save(*args, **kwargs)
+
     @property
     def is_read(self) -> bool:
         return self.read_at is not None
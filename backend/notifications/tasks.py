@@ -0,0 +1,43 @@
+# notifications/tasks.py
+
+from core.background import submit_on_commit
+
+from .models import Notification, build_link
+
+
+def insert_notifications(notifications):
+    """
+    Bulk-insert unsaved Notification objects in one round trip.
+    bulk_create skips save(), so links are filled in here.
+    """
+    for notif in notifications:
+        if not notif.link:
+            notif.link = build_link(notif.entity_type, notif.entity_id)
+    Notification.objects.bulk_create(notifications, batch_size=500)
+
+
+def queue_notifications(notifications):
+    """
+    Insert a batch of unsaved Notification objects off the request thread,
+    once the current transaction commits.
+    """
+    notifications = list(notifications)
+    if not notifications:
+        return
+
+    submit_on_commit(insert_notifications, notifications)
+
+
+def fanout_notifications(user_ids, notif_type, title, message, entity_type="", entity_id=None):
+    """Queue the same notification for every user id."""
+    queue_notifications(
+        Notification(
+            user_id=uid,
+            notif_type=notif_type,
+            title=title,
+            message=message,
+            entity_type=entity_type,
+            entity_id=entity_id,
+        )
+        for uid in user_ids
+    )
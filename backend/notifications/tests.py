@@ -1,3 +1,54 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from core import background
+
+from .models import Notification
+from .tasks import fanout_notifications, queue_notifications
+
+User = get_user_model()
+
+
+def _run_inline(fn, *args, **kwargs):
+    # run the job on the test's own connection instead of a pool thread
+    return fn(*args, **kwargs)
+
+
+@mock.patch.object(background, "submit", _run_inline)
+class NotificationQueueTests(TestCase):
+    def setUp(self):
+        self.a = User.objects.create_user(username="a", email="a@example.com", password="pw")
+        self.b = User.objects.create_user(username="b", email="b@example.com", password="pw")
+
+    def test_fanout_inserts_after_commit_with_links(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            fanout_notifications(
+                [self.a.id, self.b.id],
+                notif_type=Notification.Type.TICKET_CREATED,
+                title="New ticket created",
+                message="m",
+                entity_type="ticket",
+                entity_id=7,
+            )
+            self.assertFalse(Notification.objects.exists())
+
+        self.assertEqual(
+            sorted(Notification.objects.values_list("user_id", "link")),
+            [(self.a.id, "/tickets?focus=7"), (self.b.id, "/tickets?focus=7")],
+        )
+
+    def test_queue_inserts_mixed_batch(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_notifications(
+                [
+                    Notification(user_id=self.a.id, title="Asset assigned", entity_type="assignment", entity_id=3),
+                    Notification(user_id=self.b.id, title="Ticket updated", entity_type="ticket", entity_id=4),
+                ]
+            )
+
+        self.assertEqual(
+            sorted(Notification.objects.values_list("title", "link")),
+            [("Asset assigned", "/assignments?focus=3"), ("Ticket updated", "/tickets?focus=4")],
+        )
@@ -4,12 +4,26 @@ from collections.abc import Mapping
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from .models import Notification
 from .serializers import NotificationSerializer
 
+# the serializer only reads the notification's own scalar columns
+NOTIFICATION_COLUMNS = (
+    "id",
+    "title",
+    "message",
+    "notif_type",
+    "entity_type",
+    "entity_id",
+    "created_at",
+    "read_at",
+    "link",
+)
+
 
 class NotificationViewSet(viewsets.ModelViewSet):
     """
@@ -23,10 +37,17 @@ class NotificationViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "patch", "head", "options", "post"]
 
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by("-created_at")
+        return (
+            Notification.objects.filter(user=self.request.user)
+            .only(*NOTIFICATION_COLUMNS)
+            .order_by("-created_at")
+        )
 
     def partial_update(self, request, *args, **kwargs):
-        instance = self.get_object()
+        try:
+            pk = int(kwargs["pk"])
+        except (TypeError, ValueError):
+            raise NotFound()
 
         data = request.data if isinstance(request.data, Mapping) else {}
 
@@ -36,16 +57,20 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer = self.get_serializer(
-            instance,
-            data={"read": data.get("read")},
-            partial=True,
-        )
+        serializer = self.get_serializer(data={"read": data.get("read")}, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        make_read = serializer.validated_data["read"]
 
-        instance.refresh_from_db()
-        return Response(self.get_serializer(instance).data, status=status.HTTP_200_OK)
+        # one UPDATE scoped to the caller's rows, no fetch / re-serialize round trip
+        read_at = timezone.now() if make_read else None
+        updated = self.get_queryset().filter(pk=pk).update(read_at=read_at)
+        if not updated:
+            raise NotFound()
+
+        return Response(
+            {"id": pk, "read_at": read_at, "is_read": make_read},
+            status=status.HTTP_200_OK,
+        )
 
     @action(detail=False, methods=["post"], url_path="mark-all-read")
     def mark_all_read(self, request):